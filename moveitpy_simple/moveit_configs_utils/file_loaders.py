@@ -1,6 +1,8 @@
 """Utility functions for loading files and parsing them with jinja2."""
 
+import contextlib
 import math
+from collections import OrderedDict
 from copy import deepcopy
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -9,14 +11,24 @@ import jinja2
 import xacro
 import yaml
 
+# Use the libyaml C bindings for parsing when PyYAML was built with them
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# The delimiters of jinja2's expressions, statements and comments
+_JINJA2_MARKERS = (b"{{", b"{%", b"{#")
+
+
+def _render_template_string(template: str, mappings: dict) -> str:
+    """Render a jinja2 template string with the given mappings."""
+    jinja2_template = jinja2.Template(template)
+    jinja2_template.globals["radians"] = math.radians
+    jinja2_template.globals["degrees"] = math.degrees
+    return jinja2_template.render(mappings)
+
 
 def render_template(template: Path, mappings: dict) -> str:
     """Render a jinja2 template with the given mappings."""
     with template.open("r") as file:
-        jinja2_template = jinja2.Template(file.read())
-        jinja2_template.globals["radians"] = math.radians
-        jinja2_template.globals["degrees"] = math.degrees
-    return jinja2_template.render(mappings)
+        return _render_template_string(file.read(), mappings)
 
 
 def raise_if_file_not_found(file_path: Path) -> None:
@@ -52,21 +64,105 @@ def load_file(file_path: Path, mappings: dict | None = None) -> str | None:
 
 def load_yaml(file_path: Path, mappings: dict | None = None) -> dict | None:
     """Load a yaml file and render it with the given mappings."""
-    raise_if_file_not_found(file_path)
-
+    # Opening the file reports a missing file, no need to check for it beforehand
     try:
-        return yaml.safe_load(render_template(file_path, mappings or {}))
+        content = file_path.read_bytes()
+    except FileNotFoundError as e:
+        msg = f"File {file_path} doesn't exist"
+        raise FileNotFoundError(msg) from e
     except OSError:  # parent of IOError, OSError *and* WindowsError where available
         return None
+    # Files without any jinja2 syntax are parsed as is
+    if any(marker in content for marker in _JINJA2_MARKERS):
+        content = _render_template_string(content.decode(), mappings or {})
+    return yaml.load(content, Loader=YAML_LOADER)  # noqa: S506 (Always a safe loader)
+
+
+# Expanded xacro files keyed by the file path and mappings, each entry keeps the modification times of the files it was
+# expanded from (The xacro file and all the files it includes) to detect changes. The least recently used entries are
+# dropped once the cache is full, same as the yaml and toml caches
+_XACRO_CACHE: OrderedDict[tuple, tuple[str, dict[str, int]]] = OrderedDict()
+_XACRO_CACHE_SIZE = 128
+
+
+def get_modification_times(files: list) -> dict[str, int]:
+    """Get the modification time of each file."""
+    return {str(file): Path(file).stat().st_mtime_ns for file in files}
+
+
+def files_unchanged(modification_times: dict[str, int]) -> bool:
+    """Check if none of the files were modified since their modification times were taken."""
+    try:
+        return all(
+            Path(file).stat().st_mtime_ns == mtime_ns
+            for file, mtime_ns in modification_times.items()
+        )
+    except OSError:
+        return False
+
+
+def _xacro_cache_key(file_path: Path, mappings: dict | None) -> tuple | None:
+    """Get the key of a xacro file in the cache, None if the mappings can't be hashed."""
+    try:
+        cache_key = (str(file_path), tuple(sorted((mappings or {}).items())))
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
+def get_xacro_dependencies(file_path: Path, mappings: dict | None = None) -> list[str]:
+    """Get the files the last expansion of a xacro file with the given mappings was made from.
+
+    Returns:
+        The xacro file and all the files it includes, an empty list if the xacro file wasn't loaded with load_xacro.
+    """
+    if (cache_key := _xacro_cache_key(file_path, mappings)) is None or (
+        cached := _XACRO_CACHE.get(cache_key)
+    ) is None:
+        return []
+    return list(cached[1])
 
 
 def load_xacro(file_path: Path, mappings: dict | None = None) -> str:
-    """Load a xacro file and render it with the given mappings."""
+    """Load a xacro file and render it with the given mappings.
+
+    The expanded file is cached until the xacro file or any of the files it includes is modified.
+    """
     raise_if_file_not_found(file_path)
 
+    cache_key = _xacro_cache_key(file_path, mappings)
+    if (
+        cache_key is not None
+        and (cached := _XACRO_CACHE.get(cache_key)) is not None
+        and files_unchanged(cached[1])
+    ):
+        _XACRO_CACHE.move_to_end(cache_key)
+        return cached[0]
+
+    # Take the xacro file's modification time before expanding it, so editing it during the expansion invalidates the
+    # cached expansion
+    modification_times = get_modification_times([file_path])
+    # xacro keeps track of all the included files in a module-level list
+    includes = getattr(xacro, "all_includes", None)
+    first_include = len(includes) if includes is not None else 0
     # We need to deepcopy the mappings because xacro.process_file modifies them
     file = xacro.process_file(
         file_path,
         mappings=deepcopy(mappings) if mappings else {},
     )
-    return file.toxml()
+    expanded_file = file.toxml()
+    if cache_key is not None and includes is not None:
+        with contextlib.suppress(OSError):
+            # The included files are only known once the file is expanded
+            _XACRO_CACHE[cache_key] = (
+                expanded_file,
+                {
+                    **get_modification_times(includes[first_include:]),
+                    **modification_times,
+                },
+            )
+            _XACRO_CACHE.move_to_end(cache_key)
+            if len(_XACRO_CACHE) > _XACRO_CACHE_SIZE:
+                _XACRO_CACHE.popitem(last=False)
+    return expanded_file
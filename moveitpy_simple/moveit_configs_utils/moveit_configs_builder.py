@@ -98,28 +98,40 @@ Example:
 """
 
 import contextlib
+import functools
+import json
 import logging
-from dataclasses import InitVar, dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import InitVar, asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import ClassVar
 
 import ament_index_python.packages as ament_packages
-import toml
-from ament_index_python.packages import get_package_share_directory
+from ament_index_python.packages import get_package_share_path
 from launch.some_substitutions_type import SomeSubstitutionsType
+from launch.substitutions import TextSubstitution
 from launch_ros.parameter_descriptions import ParameterValue
-from moveit_configs_utils.substitutions import Xacro
 
 from moveitpy_simple.moveit_configs_utils.file_loaders import (
+    files_unchanged,
+    get_modification_times,
+    get_xacro_dependencies,
     load_xacro,
     load_yaml,
     raise_if_file_not_found,
 )
+from moveitpy_simple.moveit_configs_utils.substitutions import Xacro
 
 LOGGER = logging.getLogger(__name__)
 COLOR_YELLOW = "\x1b[33;20m"
 COLOR_RESET = "\x1b[0m"
-logging.basicConfig(level=logging.INFO)
+# Types of the values in moveit_configs.toml that are paths, evaluating Path | str creates a new union on every call
+_PATH_TYPES = (Path, str)
+_PACKAGE_PREFIX = "package://"
+# Maximum number of threads used to load config files in parallel
+_MAX_LOAD_WORKERS = 8
 
 
 def normalize_path_value(value: str) -> Path:
@@ -131,16 +143,25 @@ def normalize_path_value(value: str) -> Path:
     Returns:
         Package name
     """
-    if isinstance(value, str) and value.startswith("package://"):
-        package_name, relative_path = value.split("package://")[1].split("/", 1)
-        return get_package_path(package_name) / relative_path
-    return value
+    if not (isinstance(value, str) and value.startswith(_PACKAGE_PREFIX)):
+        return value
+    package_name, _, relative_path = value.removeprefix(_PACKAGE_PREFIX).partition("/")
+    return get_package_path(package_name) / relative_path
 
 
 class PackageNotFoundError(KeyError):
     """Raised when a package is not found."""
 
 
+@functools.cache
+def _get_package_share_path(package_name: str) -> Path:
+    """Get the share directory of a package, the ament index is only crawled once per package.
+
+    Lookups that raise are not cached, so a package installed later in the process will still be found.
+    """
+    return get_package_share_path(package_name)
+
+
 def get_full_path(path: str | Path) -> Path:
     """Get the full path to a file/directory.
 
@@ -152,11 +173,10 @@ def get_full_path(path: str | Path) -> Path:
     """
     if isinstance(path, str):
         try:
-            full_path = get_package_share_directory(path)
+            return _get_package_share_path(path)
         except ament_packages.PackageNotFoundError as e:
             msg = f"Path to a package {path} not found"
             raise PackageNotFoundError(msg) from e
-        return Path(full_path)
     if isinstance(path, Path):
         if path.exists():
             return path
@@ -165,10 +185,27 @@ def get_full_path(path: str | Path) -> Path:
     return None
 
 
+def _package_path_from_full_path(full_path: Path) -> Path:
+    """Get the path to a package from a full path returned by get_full_path."""
+    return full_path.parent if full_path.is_file() else full_path
+
+
 def get_package_path(package: str | Path) -> Path:
     """Get the full path to a package."""
-    package_path = get_full_path(package)
-    return package_path.parent if package_path.is_file() else package_path
+    return _package_path_from_full_path(get_full_path(package))
+
+
+@functools.lru_cache
+def _load_toml(file_path: Path, mtime_ns: int) -> dict:
+    """Parse a toml file, the modification time is part of the cache key so edited files are parsed again."""
+    # Imported here so importing this module doesn't pay for the parser unless a toml file is loaded
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # Python < 3.11
+        import tomli as tomllib
+
+    with file_path.open("rb") as file:
+        return tomllib.load(file)
 
 
 def load_moveit_configs_toml(file_path: Path) -> dict:
@@ -181,7 +218,10 @@ def load_moveit_configs_toml(file_path: Path) -> dict:
         Loaded configs or an empty dict if moveit_configs.toml doesn't exists
     """
     if file_path.is_file() or (file_path := file_path / "moveit_configs.toml").exists():
-        return toml.load(file_path)
+        # Return a copy since extend_configs modifies the loaded configs in place
+        return deepcopy(
+            _load_toml(file_path.resolve(), file_path.stat().st_mtime_ns),
+        )
     return {}
 
 
@@ -194,21 +234,20 @@ def get_missing_configs(configs: dict) -> list[str]:
     Returns:
         Return a list of missing sections (Doesn't include the extend key)
     """
-    missing_configs = [
+    moveit_configs = configs.get(_MOVEIT_CONFIGS_KEY) or {}
+    return [
         section
-        for section in ConfigSections
-        if configs.get(ConfigSections.MOVEIT_CONFIGS, {}).get(section) is None
+        for section in _CONFIG_SECTIONS_TO_CHECK
+        if moveit_configs.get(section) is None
     ]
-    missing_configs.remove(ConfigSections.MOVEIT_CONFIGS)
-    with contextlib.suppress(ValueError):
-        missing_configs.remove(ConfigSections.EXTEND)
-
-    return missing_configs
 
 
 def extend_configs(package_path: Path, configs: dict) -> dict:
     """Extend package_path's moveit_configs with another package.
 
+    The configs are extended in place by walking the chain of extended packages until either all sections are
+    found or a package doesn't extend any other package.
+
     Args:
         package_path: Path to the package that contains the moveit_configs.toml file
         configs: The configs loaded from the moveit_configs.toml file
@@ -216,61 +255,76 @@ def extend_configs(package_path: Path, configs: dict) -> dict:
     Returns:
         Extended configs if moveit_configs.toml contains an extend key
     """
-    if (
-        len(missing_sections := get_missing_configs(configs)) == 0
-        or (
-            base_package := configs.get(ConfigSections.MOVEIT_CONFIGS, {}).get(
-                ConfigSections.EXTEND,
+    missing_sections = get_missing_configs(configs)
+    extended_moveit_configs = configs.get(_MOVEIT_CONFIGS_KEY, {})
+    # The toml files loaded by the extend chain, a file that is loaded twice means the configs extend each other
+    extended_files = []
+    while missing_sections and (
+        base_package := extended_moveit_configs.pop(_EXTEND_KEY, None)
+    ):
+        local_base_config_path = package_path / base_package
+        base_config_path = (
+            local_base_config_path if local_base_config_path.exists() else base_package
+        )
+        base_config_full_path = get_full_path(base_config_path)
+        package_path = _package_path_from_full_path(base_config_full_path)
+        # Compare the files, different toml files in the same package can extend each other
+        base_config_file = (
+            base_config_full_path
+            if base_config_full_path.is_file()
+            else base_config_full_path / "moveit_configs.toml"
+        ).resolve()
+        if base_config_file in extended_files:
+            chain = " -> ".join(
+                str(path) for path in [*extended_files, base_config_file]
             )
+            msg = f"Cyclic extend in moveit_configs.toml: {chain}"
+            raise RuntimeError(msg)
+        extended_files.append(base_config_file)
+        base_package_configs = load_moveit_configs_toml(base_config_full_path)
+        base_moveit_configs = base_package_configs.get(
+            _MOVEIT_CONFIGS_KEY,
+            {},
         )
-        is None
-    ):
-        return configs
-    base_config_path = (
-        package_path / base_package
-        if (package_path / base_package).exists()
-        else base_package
-    )
-    base_package = get_package_path(base_config_path)
-    base_package_configs = load_moveit_configs_toml(get_full_path(base_config_path))
-    extended_configs = configs.copy()
-    extended_moveit_configs = extended_configs[ConfigSections.MOVEIT_CONFIGS]
-    extended_moveit_configs.pop(ConfigSections.EXTEND)
-    missing_sections.append(ConfigSections.EXTEND)
-    for missing_section in missing_sections:
-        if (
-            missing_section_value := base_package_configs.get(
-                ConfigSections.MOVEIT_CONFIGS,
-                {},
-            ).get(missing_section)
-        ) is not None:
-            if isinstance(missing_section_value, Path | str):
+        # The base package's extend is resolved relative to the base package in the next iteration
+        if (base_extend := base_moveit_configs.get(_EXTEND_KEY)) is not None:
+            extended_moveit_configs[_EXTEND_KEY] = normalize_path_value(
+                base_extend,
+            )
+        for missing_section in missing_sections:
+            if (
+                missing_section_value := base_moveit_configs.get(missing_section)
+            ) is None:
+                continue
+            if isinstance(missing_section_value, _PATH_TYPES):
                 extended_moveit_configs[
                     missing_section
-                ] = base_package / normalize_path_value(missing_section_value)
+                ] = package_path / normalize_path_value(missing_section_value)
             elif isinstance(missing_section_value, dict):
                 resolved_missing_section_value = {
-                    key: base_package / normalize_path_value(value)
-                    if isinstance(value, Path | str)
-                    else normalize_path_value(value)
+                    key: package_path / normalize_path_value(value)
+                    if isinstance(value, _PATH_TYPES)
+                    else value
                     for key, value in missing_section_value.items()
                 }
                 extended_moveit_configs[
                     missing_section
                 ] = resolved_missing_section_value
             else:
-                msg = f"Invalid type for {missing_section} in {base_package} moveit_configs.toml"
+                msg = f"Invalid type for {missing_section} in {package_path} moveit_configs.toml"
                 raise TypeError(
                     msg,
                 )
-            extended_configs[missing_section] = base_package_configs.get(
+            configs[missing_section] = base_package_configs.get(
                 missing_section,
             )
+        missing_sections = [
+            missing_section
+            for missing_section in missing_sections
+            if missing_section not in base_moveit_configs
+        ]
 
-    return extend_configs(
-        base_package,
-        extended_configs,
-    )
+    return configs
 
 
 class ConfigSections(str, Enum):
@@ -289,12 +343,137 @@ class ConfigSections(str, Enum):
     PILZ_CARTESIAN_LIMITS = "pilz_cartesian_limits"
 
 
+# Sections that contain a config file (Excludes the moveit_configs table and the extend key), in definition order
+_CONFIG_SECTIONS_TO_CHECK = tuple(
+    section
+    for section in ConfigSections
+    if section not in (ConfigSections.MOVEIT_CONFIGS, ConfigSections.EXTEND)
+)
+# Plain string keys for the tables that are looked up while loading and extending configs
+_MOVEIT_CONFIGS_KEY = ConfigSections.MOVEIT_CONFIGS.value
+_EXTEND_KEY = ConfigSections.EXTEND.value
+
+
+def _is_text_substitutions(value: object) -> bool:
+    """Check if a mapping's value is a text substitution or a list of strings and text substitutions."""
+    if isinstance(value, TextSubstitution):
+        return True
+    return (
+        isinstance(value, list | tuple)
+        and any(isinstance(item, TextSubstitution) for item in value)
+        and all(isinstance(item, str | TextSubstitution) for item in value)
+    )
+
+
+def _substitutions_text(value: TextSubstitution | list | tuple) -> str:
+    """Get the text of a text substitution or a list of strings and text substitutions."""
+    if isinstance(value, TextSubstitution):
+        return value.text
+    return "".join(
+        item.text if isinstance(item, TextSubstitution) else item for item in value
+    )
+
+
 @dataclass(slots=True)
 class ConfigEntry:
     """A class that contains a path to a config file and a dictionary of mappings."""
 
     path: Path
     mappings: dict
+    # Whether all the mappings' keys and values are strings (i.e. no ros2 launch substitutions)
+    all_str_mappings: bool = field(init=False, repr=False)
+    # The path as a string, passed to the Xacro substitution
+    path_str: str = field(init=False, repr=False)
+    # The mappings as a sorted tuple to be used as a cache key, None if the mappings can't be hashed
+    mappings_key: tuple | None = field(init=False, repr=False, compare=False)
+    _xacro_parameter_value: ParameterValue | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        """Check the mappings' types, convert the path and make the cache key once instead of every time the configs are created."""
+        self.path_str = str(self.path)
+        if self.mappings is not None:
+            # Copy the caller's mappings so modifying them later can't make the cache key below stale.
+            # Text substitutions don't depend on the launch context, replacing them with their text makes it possible
+            # to load the file when the configs are created instead of at launch time
+            self.mappings = {
+                key: _substitutions_text(value)
+                if _is_text_substitutions(value)
+                else value
+                for key, value in self.mappings.items()
+            }
+        self.all_str_mappings = self.mappings is None or all(
+            isinstance(key, str) and isinstance(value, str)
+            for key, value in self.mappings.items()
+        )
+        try:
+            self.mappings_key = tuple(sorted((self.mappings or {}).items()))
+            hash(self.mappings_key)
+        except TypeError:
+            self.mappings_key = None
+
+    def xacro_parameter_value(self) -> ParameterValue:
+        """Get the xacro file as a ParameterValue to be expanded with the mappings' substitutions at launch time.
+
+        The ParameterValue is created on the first call and reused by the following ones.
+        """
+        if self._xacro_parameter_value is None:
+            self._xacro_parameter_value = ParameterValue(
+                Xacro(self.path_str, mappings=self.mappings),
+                value_type=str,
+            )
+        return self._xacro_parameter_value
+
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(file_path: Path, mtime_ns: int, mappings: tuple) -> dict | None:
+    """Load a yaml file, the modification time and the mappings are part of the cache key so changes are picked up."""
+    return load_yaml(file_path, mappings=dict(mappings))
+
+
+def _load_yaml(config: ConfigEntry) -> dict | None:
+    """Load the yaml file of a ConfigEntry, unchanged files loaded with the same mappings are only parsed once.
+
+    The returned dict can be shared with the cache, it must be copied before being modified.
+    """
+    # Mappings with unhashable values can't be part of the cache key
+    if config.mappings_key is None:
+        return load_yaml(config.path, mappings=config.mappings)
+    try:
+        stat = config.path.stat()
+    except FileNotFoundError:
+        # load_yaml reports missing files
+        return load_yaml(config.path, mappings=config.mappings)
+    # Empty files don't need to be parsed (e.g. placeholder configs)
+    if stat.st_size == 0:
+        return None
+    return _load_yaml_cached(config.path, stat.st_mtime_ns, config.mappings_key)
+
+
+@functools.cache
+def _load_executor() -> ThreadPoolExecutor:
+    """Get the thread pool used to load config files, created on first use and shared by all the builders."""
+    return ThreadPoolExecutor(
+        max_workers=_MAX_LOAD_WORKERS,
+        thread_name_prefix="moveit_configs_loader",
+    )
+
+
+def _load_yamls(configs: list[ConfigEntry]) -> list[dict | None]:
+    """Load the yaml files of multiple ConfigEntry in parallel to overlap reading the files.
+
+    Parsing and rendering the files mostly holds the GIL, so a single file is loaded in the calling thread.
+
+    Returns:
+        The loaded yaml files in the same order as the configs.
+    """
+    if len(configs) <= 1:
+        return [_load_yaml(config) for config in configs]
+    return list(_load_executor().map(_load_yaml, configs))
 
 
 @dataclass(slots=True)
@@ -305,56 +484,66 @@ class PlanningPipelinesConfigEntry:
     configs: list[ConfigEntry]
     default_planning_pipeline: str
 
+    def __post_init__(self) -> None:
+        """Check there's a config for each pipeline once so they can be zipped without checking their lengths."""
+        if len(self.pipelines) != len(self.configs):
+            msg = f"Got {len(self.configs)} configs for the {len(self.pipelines)} planning pipelines `{','.join(self.pipelines)}`"
+            raise RuntimeError(msg)
+
 
 @dataclass(slots=True)
 class MoveItConfigs:
-    """Class containing MoveIt related parameters."""
+    """Class containing MoveIt related parameters.
+
+    Sections that weren't loaded are None, sections loaded from an empty file are empty dicts. Use to_dict to pass
+    all the loaded sections to a node, or skip the None sections when passing them one by one.
+    """
 
     # A pathlib Path to the moveit config package
     package_path: str | None = None
     # A dictionary that has the contents of the URDF file.
-    robot_description: dict = field(default_factory=dict)
+    robot_description: dict | None = None
     # A dictionary that has the contents of the SRDF file.
-    robot_description_semantic: dict = field(default_factory=dict)
+    robot_description_semantic: dict | None = None
     # A dictionary IK solver specific parameters.
-    robot_description_kinematics: dict = field(default_factory=dict)
+    robot_description_kinematics: dict | None = None
     # A dictionary that contains the planning pipelines parameters.
-    planning_pipelines: dict = field(default_factory=dict)
+    planning_pipelines: dict | None = None
     # A dictionary contains parameters for trajectory execution & moveit controller managers.
-    trajectory_execution: dict = field(default_factory=dict)
+    trajectory_execution: dict | None = None
     # A dictionary that has the planning scene monitor's parameters.
-    planning_scene_monitor: dict = field(default_factory=dict)
+    planning_scene_monitor: dict | None = None
     # A dictionary that has the sensor 3d configuration parameters.
-    sensors_3d: dict = field(default_factory=dict)
+    sensors_3d: dict | None = None
     # A dictionary containing move_group's non-default capabilities.
-    move_group_capabilities: dict = field(default_factory=dict)
+    move_group_capabilities: dict | None = None
     # A dictionary containing the overridden position/velocity/acceleration limits.
-    joint_limits: dict = field(default_factory=dict)
+    joint_limits: dict | None = None
     # A dictionary containing MoveItCpp related parameters.
-    moveit_cpp: dict = field(default_factory=dict)
+    moveit_cpp: dict | None = None
     # A dictionary containing the cartesian limits for the Pilz planner.
-    pilz_cartesian_limits: dict = field(default_factory=dict)
+    pilz_cartesian_limits: dict | None = None
 
     def to_dict(self) -> dict:
-        """Merge all the parameters in a dict."""
-        parameters = {}
-        parameters |= self.robot_description
-        parameters.update(self.robot_description_semantic)
-        parameters.update(self.robot_description_kinematics)
-        parameters.update(self.planning_pipelines)
-        parameters.update(self.trajectory_execution)
-        parameters.update(self.planning_scene_monitor)
-        parameters.update(self.sensors_3d)
-        parameters.update(self.joint_limits)
-        parameters.update(self.moveit_cpp)
+        """Merge all the parameters in a dict, sections that weren't loaded are skipped."""
+        parameters = {
+            **(self.robot_description or {}),
+            **(self.robot_description_semantic or {}),
+            **(self.robot_description_kinematics or {}),
+            **(self.planning_pipelines or {}),
+            **(self.trajectory_execution or {}),
+            **(self.planning_scene_monitor or {}),
+            **(self.sensors_3d or {}),
+            **(self.joint_limits or {}),
+            **(self.moveit_cpp or {}),
+        }
         # Update robot_description_planning with pilz cartesian limits
         if self.pilz_cartesian_limits:
-            if parameters.get("robot_description_planning") is not None:
-                parameters["robot_description_planning"].update(
-                    self.pilz_cartesian_limits,
-                )
-            else:
-                parameters["robot_description_planning"] = self.pilz_cartesian_limits
+            # Create a new dict to avoid modifying joint_limits' robot_description_planning
+            parameters["robot_description_planning"] = {
+                **(parameters.get("robot_description_planning") or {}),
+                **self.pilz_cartesian_limits,
+            }
         return parameters
 
 
@@ -374,6 +563,50 @@ class MoveItConfigsBuilder:
     _joint_limits_config: ConfigEntry | None = None
     _moveit_cpp_config: ConfigEntry | None = None
     _default_configs: dict = field(default_factory=dict)
+    # The [moveit_configs] table and the mappings of each section, sliced once from _default_configs
+    _default_paths: dict = field(default_factory=dict)
+    _default_mappings: dict = field(default_factory=dict)
+    # The last loaded configs with the key of the builder's configs and the modification times of the files they
+    # were loaded from
+    _moveit_configs_cache: tuple[str, dict[str, int], MoveItConfigs] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    # Maps each section in moveit_configs.toml to the method that loads it
+    _LOAD_ALL_LOADERS: ClassVar[dict[ConfigSections, str]] = {
+        ConfigSections.ROBOT_DESCRIPTION: "robot_description",
+        ConfigSections.ROBOT_DESCRIPTION_SEMANTIC: "robot_description_semantic",
+        ConfigSections.SENSORS: "sensors",
+        ConfigSections.MOVEIT_CPP: "moveit_cpp",
+        ConfigSections.ROBOT_DESCRIPTION_KINEMATICS: "robot_description_kinematics",
+        ConfigSections.JOINT_LIMITS: "joint_limits",
+        ConfigSections.TRAJECTORY_EXECUTION: "trajectory_execution",
+        ConfigSections.PLANNING_PIPELINES: "planning_pipelines",
+        ConfigSections.PILZ_CARTESIAN_LIMITS: "pilz_cartesian_limits",
+    }
+    # The sections loaded from a xacro file: (The builder's config attribute, the MoveItConfigs field which is also
+    # the parameter name of the expanded file)
+    _XACRO_SECTIONS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("_robot_description_config", "robot_description"),
+        ("_robot_description_semantic_config", "robot_description_semantic"),
+    )
+    # The sections loaded from a single yaml file: (The builder's config attribute, the MoveItConfigs field,
+    # the parameter name the loaded yaml file is nested under or None to use it as is)
+    _YAML_SECTIONS: ClassVar[tuple[tuple[str, str, str | None], ...]] = (
+        (
+            "_robot_description_kinematics_config",
+            "robot_description_kinematics",
+            "robot_description_kinematics",
+        ),
+        ("_trajectory_execution_config", "trajectory_execution", None),
+        ("_sensors_config", "sensors_3d", None),
+        ("_joint_limits_config", "joint_limits", "robot_description_planning"),
+        ("_moveit_cpp_config", "moveit_cpp", None),
+        ("_pilz_cartesian_limits_config", "pilz_cartesian_limits", None),
+    )
 
     def __post_init__(self, package: Path | str) -> None:
         """Constructor.
@@ -381,12 +614,19 @@ class MoveItConfigsBuilder:
         Args:
             package: The package name or path to the package.
         """
+        # Resolve the package once, the section loaders only join paths onto package_path
         moveit_configs_path = get_full_path(package)
-        self.package_path = get_package_path(package)
+        self.package_path = _package_path_from_full_path(moveit_configs_path)
         self._default_configs = extend_configs(
             self.package_path,
             load_moveit_configs_toml(moveit_configs_path),
         )
+        # Note we do XXX.get(...) or {} on purpose, we might have a section with a None value
+        self._default_paths = self._default_configs.get(_MOVEIT_CONFIGS_KEY) or {}
+        self._default_mappings = {
+            section: self._default_configs.get(section) or {}
+            for section in _CONFIG_SECTIONS_TO_CHECK
+        }
 
     def _make_config_entry_from_file(
         self,
@@ -424,22 +664,13 @@ class MoveItConfigsBuilder:
         Returns:
             ConfigEntry: A ConfigEntry object.
         """
-        if not self._default_configs:
-            msg = f"Default configs are not loaded. Please provide a moveit_configs.toml file, or explicitly pass the file_path when loading MoveItConfigsBuilder('...').{section}(file_path='...')."
-            raise RuntimeError(
-                msg,
-            )
-
-        if (
-            moveit_configs := self._default_configs.get(ConfigSections.MOVEIT_CONFIGS)
-        ) is None:
-            msg = "No [moveit_configs] section found in moveit_configs.toml"
-            raise RuntimeError(
-                msg,
-            )
-
-        if (value := moveit_configs.get(section)) is None:
-            msg = f"No value {section} found for [moveit_configs] section in moveit_configs.toml"
+        if (value := self._default_paths.get(section)) is None:
+            if not self._default_configs:
+                msg = f"Default configs are not loaded. Please provide a moveit_configs.toml file, or explicitly pass the file_path when loading MoveItConfigsBuilder('...').{section}(file_path='...')."
+            elif ConfigSections.MOVEIT_CONFIGS not in self._default_configs:
+                msg = "No [moveit_configs] section found in moveit_configs.toml"
+            else:
+                msg = f"No value {section} found for [moveit_configs] section in moveit_configs.toml"
             raise RuntimeError(
                 msg,
             )
@@ -452,12 +683,11 @@ class MoveItConfigsBuilder:
 
         return ConfigEntry(
             path=self.package_path / normalize_path_value(value),
-            # Note we do XXX.get(...) or {} on purpose, we might have a section with a None value
             mappings=mappings
             or (
-                (self._default_configs.get(section) or {}).get(option, {})
+                self._default_mappings[section].get(option, {})
                 if option
-                else self._default_configs.get(section, {})
+                else self._default_mappings[section]
             ),
         )
 
@@ -695,9 +925,7 @@ class MoveItConfigsBuilder:
             ]
         else:
             pipelines = list(
-                self._default_configs.get(ConfigSections.MOVEIT_CONFIGS, {})
-                .get(ConfigSections.PLANNING_PIPELINES, {})
-                .keys(),
+                self._default_paths.get(ConfigSections.PLANNING_PIPELINES, {}).keys(),
             )
             planning_pipelines_configs = [
                 self._make_config_entry_from_section(
@@ -763,143 +991,223 @@ class MoveItConfigsBuilder:
             LOGGER.warning(
                 f"{COLOR_YELLOW}Request to load all configs, but no default configs found. Make sure to create moveit_configs.toml file.{COLOR_RESET}",
             )
-        existing_configs = [
-            section
-            for section in ConfigSections
-            if self._default_configs.get(ConfigSections.MOVEIT_CONFIGS, {}).get(section)
-            is not None
-        ]
-        for config in existing_configs:
-            match config:
-                case ConfigSections.ROBOT_DESCRIPTION:
-                    self.robot_description()
-                case ConfigSections.ROBOT_DESCRIPTION_SEMANTIC:
-                    self.robot_description_semantic()
-                case ConfigSections.SENSORS:
-                    self.sensors()
-                case ConfigSections.MOVEIT_CPP:
-                    self.moveit_cpp()
-                case ConfigSections.ROBOT_DESCRIPTION_KINEMATICS:
-                    self.robot_description_kinematics()
-                case ConfigSections.JOINT_LIMITS:
-                    self.joint_limits()
-                case ConfigSections.TRAJECTORY_EXECUTION:
-                    self.trajectory_execution()
-                case ConfigSections.PLANNING_PIPELINES:
-                    self.planning_pipelines()
-                case ConfigSections.PILZ_CARTESIAN_LIMITS:
-                    self.pilz_cartesian_limits()
+        for section, loader in self._LOAD_ALL_LOADERS.items():
+            if self._default_paths.get(section) is not None:
+                getattr(self, loader)()
         return self
 
-    def to_moveit_configs(self) -> MoveItConfigs:  # noqa: C901, PLR0912
+    @staticmethod
+    def clear_yaml_cache() -> None:
+        """Clear the cache of the parsed yaml files shared by all the builders.
+
+        Builders keep reusing the configs they already loaded until their files change, use clear_cache to reload them.
+        """
+        _load_yaml_cached.cache_clear()
+
+    def clear_cache(self) -> None:
+        """Clear the configs loaded by this builder and the parsed yaml files, e.g. to force reloading files in tests."""
+        self._moveit_configs_cache = None
+        self.clear_yaml_cache()
+
+    def to_moveit_configs(self) -> MoveItConfigs:
         """Get MoveIt configs from ROBOT_NAME_moveit_config.
 
+        The loaded configs are reused by the following calls until the builder's configs or any of the files they
+        were loaded from change.
+
         Returns:
             An MoveItConfigs instance with all parameters loaded.
         """
+        configs_key = self._configs_key()
+        if (
+            self._moveit_configs_cache is None
+            or self._moveit_configs_cache[0] != configs_key
+            or not files_unchanged(self._moveit_configs_cache[1])
+        ):
+            # Take the modification times before loading the files, so a file modified while it's loaded is loaded
+            # again by the next call. Missing files are reported when loading them
+            try:
+                modification_times = get_modification_times(self._config_files())
+            except OSError:
+                modification_times = {}
+            moveit_configs = self._load_moveit_configs()
+            # The files included by the xacro files are only known once they're expanded
+            self._moveit_configs_cache = (
+                configs_key,
+                {
+                    **get_modification_times(self._config_files()),
+                    **modification_times,
+                },
+                moveit_configs,
+            )
+        # Return a copy so modifying the returned configs doesn't modify the cached ones, the loaded yaml files are only
+        # copied here. The xacro ParameterValues aren't modified so they're shared instead of copied
+        moveit_configs = self._moveit_configs_cache[2]
+        return deepcopy(
+            moveit_configs,
+            {
+                id(parameter_value): parameter_value
+                for _, section in self._XACRO_SECTIONS
+                for parameter_value in (getattr(moveit_configs, section) or {}).values()
+                if isinstance(parameter_value, ParameterValue)
+            },
+        )
+
+    def _load_moveit_configs(self) -> MoveItConfigs:
+        """Load MoveIt configs from the files of the builder's configs."""
         moveit_configs = MoveItConfigs()
-        if self._robot_description_config is not None:
-            # If mappings is None or a dictionary of strings, load the xacro file as a string.
-            # Otherwise, load it as a ParameterValue.
-            # This makes it possible to use the builder with MoveItPy while still being able to
-            # use a ros2 launch's substitution types.
-            if (self._robot_description_config.mappings is None) or all(
-                (isinstance(key, str) and isinstance(value, str))
-                for key, value in self._robot_description_config.mappings.items()
-            ):
-                moveit_configs.robot_description = {
-                    "robot_description": load_xacro(
-                        self._robot_description_config.path,
-                        mappings=self._robot_description_config.mappings,
-                    ),
-                }
-            else:
-                moveit_configs.robot_description = {
-                    "robot_description": ParameterValue(
-                        Xacro(
-                            str(self._robot_description_config.path),
-                            mappings=self._robot_description_config.mappings,
-                        ),
-                        value_type=str,
-                    ),
-                }
+        for config_name, section in self._XACRO_SECTIONS:
+            if (config := getattr(self, config_name)) is not None:
+                # If mappings is None or a dictionary of strings, load the xacro file as a string.
+                # Otherwise, load it as a ParameterValue.
+                # This makes it possible to use the builder with MoveItPy while still being able to
+                # use a ros2 launch's substitution types.
+                setattr(
+                    moveit_configs,
+                    section,
+                    {
+                        section: load_xacro(config.path, mappings=config.mappings)
+                        if config.all_str_mappings
+                        else config.xacro_parameter_value(),
+                    },
+                )
 
-        if self._robot_description_semantic_config is not None:
-            # Support both MoveItPy and ros2 launch substitution types similar to robot_description
-            if (self._robot_description_semantic_config.mappings is None) or all(
-                (isinstance(key, str) and isinstance(value, str))
-                for key, value in self._robot_description_semantic_config.mappings.items()
-            ):
-                moveit_configs.robot_description_semantic = {
-                    "robot_description_semantic": load_xacro(
-                        self._robot_description_semantic_config.path,
-                        mappings=self._robot_description_semantic_config.mappings,
-                    ),
-                }
-            else:
-                moveit_configs.robot_description_semantic = {
-                    "robot_description_semantic": ParameterValue(
-                        Xacro(
-                            str(self._robot_description_semantic_config.path),
-                            mappings=self._robot_description_semantic_config.mappings,
-                        ),
-                        value_type=str,
-                    ),
-                }
+        yaml_sections = [
+            (section, parameter_name, config)
+            for config_name, section, parameter_name in self._YAML_SECTIONS
+            if (config := getattr(self, config_name)) is not None
+        ]
+        pipeline_configs = (
+            self._planning_pipelines_config.configs
+            if self._planning_pipelines_config
+            else []
+        )
+        # Load all the yaml files in parallel to overlap reading and parsing them, the loaded files are in the same
+        # order as the sections followed by the planning pipelines
+        loaded_yamls = iter(
+            _load_yamls(
+                [*(config for _, _, config in yaml_sections), *pipeline_configs],
+            ),
+        )
 
-        if self._robot_description_kinematics_config is not None:
-            moveit_configs.robot_description_kinematics = {
-                "robot_description_kinematics": load_yaml(
-                    self._robot_description_kinematics_config.path,
-                    mappings=self._robot_description_kinematics_config.mappings,
-                ),
-            }
+        for section, parameter_name, _ in yaml_sections:
+            # Sections loaded from an empty file are empty dicts instead of having a None parameter
+            if (parameters := next(loaded_yamls)) is None:
+                setattr(moveit_configs, section, {})
+                continue
+            # The loaded files are shared with the yaml cache and between configs loading the same file, copy them so
+            # each section is independent
+            parameters = deepcopy(parameters)
+            setattr(
+                moveit_configs,
+                section,
+                parameters if parameter_name is None else {parameter_name: parameters},
+            )
 
         if self._planning_pipelines_config:
             moveit_configs.planning_pipelines = {
                 "planning_pipelines.pipeline_names": self._planning_pipelines_config.pipelines,
                 "default_planning_pipeline": self._planning_pipelines_config.default_planning_pipeline,
+                # PlanningPipelinesConfigEntry checks there's a config for each pipeline
+                **dict(
+                    zip(
+                        self._planning_pipelines_config.pipelines,
+                        (deepcopy(parameters) for parameters in loaded_yamls),
+                        strict=False,
+                    ),
+                ),
             }
-            for pipeline, pipeline_config in zip(
-                self._planning_pipelines_config.pipelines,
-                self._planning_pipelines_config.configs,
-                strict=True,
-            ):
-                moveit_configs.planning_pipelines[pipeline] = load_yaml(
-                    file_path=pipeline_config.path,
-                    mappings=pipeline_config.mappings,
-                )
+        return moveit_configs
 
-        if self._trajectory_execution_config is not None:
-            moveit_configs.trajectory_execution = load_yaml(
-                self._trajectory_execution_config.path,
-                mappings=self._trajectory_execution_config.mappings,
-            )
+    def _configs_key(self) -> str:
+        """Get a key that identifies the files and mappings the builder loads the configs from."""
+        return repr(
+            (
+                self._robot_description_config,
+                self._robot_description_semantic_config,
+                self._robot_description_kinematics_config,
+                self._planning_pipelines_config,
+                self._trajectory_execution_config,
+                self._sensors_config,
+                self._pilz_cartesian_limits_config,
+                self._joint_limits_config,
+                self._moveit_cpp_config,
+            ),
+        )
 
-        if self._sensors_config is not None:
-            moveit_configs.sensors_3d = load_yaml(
-                self._sensors_config.path,
-                mappings=self._sensors_config.mappings,
+    def _config_files(self) -> list[Path | str]:
+        """Get all the files the configs are loaded from, including the files included by the xacro files."""
+        files = []
+        for config_name, _ in self._XACRO_SECTIONS:
+            if (config := getattr(self, config_name)) is not None:
+                files.extend(
+                    get_xacro_dependencies(config.path, config.mappings)
+                    or [config.path],
+                )
+        for config_name, _, _ in self._YAML_SECTIONS:
+            if (config := getattr(self, config_name)) is not None:
+                files.append(config.path)
+        if self._planning_pipelines_config is not None:
+            files.extend(
+                config.path for config in self._planning_pipelines_config.configs
             )
+        return files
 
-        if self._joint_limits_config is not None:
-            moveit_configs.joint_limits = {
-                "robot_description_planning": load_yaml(
-                    self._joint_limits_config.path,
-                    mappings=self._joint_limits_config.mappings,
-                ),
-            }
+    def freeze(self, file_path: Path | str) -> MoveItConfigs:
+        """Load the MoveIt configs and write them to a json file to be loaded later with from_frozen.
 
-        if self._moveit_cpp_config is not None:
-            moveit_configs.moveit_cpp = load_yaml(
-                self._moveit_cpp_config.path,
-                mappings=self._moveit_cpp_config.mappings,
-            )
+        Only configs that json can represent can be frozen, i.e. the robot description's mappings must be strings and
+        the yaml files can only have string keys and no tuples, dates or timestamps.
 
-        # if not moveit_configs.planning_scene_monitor:
-        if self._pilz_cartesian_limits_config is not None:
-            moveit_configs.pilz_cartesian_limits = load_yaml(
-                self._pilz_cartesian_limits_config.path,
-                mappings=self._pilz_cartesian_limits_config.mappings,
-            )
+        Args:
+            file_path: The path to the file to write the configs to.
+
+        Returns:
+            An MoveItConfigs instance with all parameters loaded.
+
+        Raises:
+            TypeError: If the configs can't be written to a json file without changing them.
+        """
+        moveit_configs = self.to_moveit_configs()
+        moveit_configs_dict = asdict(moveit_configs)
+        try:
+            frozen_moveit_configs = json.dumps(moveit_configs_dict)
+        except (TypeError, ValueError) as e:
+            msg = f"MoveIt configs can't be frozen to {file_path}: {e}"
+            raise TypeError(msg) from e
+        # json turns tuples into lists and non-string keys into strings
+        if json.loads(frozen_moveit_configs) != moveit_configs_dict:
+            msg = f"MoveIt configs can't be frozen to {file_path}: they have tuples or non-string keys that json would change"
+            raise TypeError(msg)
+        Path(file_path).write_text(
+            json.dumps(
+                {
+                    "configs": self._configs_key(),
+                    # The modification times taken by to_moveit_configs before loading the files
+                    "files": self._moveit_configs_cache[1],
+                    "moveit_configs": moveit_configs_dict,
+                },
+            ),
+        )
         return moveit_configs
+
+    def from_frozen(self, file_path: Path | str) -> MoveItConfigs:
+        """Get the MoveIt configs written to a json file by freeze.
+
+        The configs are loaded and frozen again if the file doesn't exist, or if the builder's configs or any of the
+        files they were loaded from changed since they were frozen.
+
+        Args:
+            file_path: The path to the file the configs were written to.
+
+        Returns:
+            An MoveItConfigs instance with all parameters loaded.
+        """
+        # Files that can't be read or were frozen with different MoveItConfigs fields are frozen again
+        with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+            frozen = json.loads(Path(file_path).read_text())
+            if frozen["configs"] == self._configs_key() and files_unchanged(
+                frozen["files"],
+            ):
+                return MoveItConfigs(**frozen["moveit_configs"])
+        return self.freeze(file_path)
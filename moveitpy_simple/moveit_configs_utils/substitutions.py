@@ -0,0 +1,72 @@
+"""Launch substitutions."""
+
+from pathlib import Path
+
+from launch.launch_context import LaunchContext
+from launch.some_substitutions_type import SomeSubstitutionsType
+from launch.substitution import Substitution
+from launch.utilities import normalize_to_list_of_substitutions, perform_substitutions
+
+from moveitpy_simple.moveit_configs_utils.file_loaders import load_xacro
+
+
+class Xacro(Substitution):
+    """Substitution that expands a xacro file with its mappings at launch time.
+
+    Same as moveit_configs_utils' Xacro substitution, but the file is expanded with load_xacro which reuses the
+    expanded file until the file or any of the files it includes is modified.
+    """
+
+    def __init__(
+        self,
+        file_path: SomeSubstitutionsType,
+        *,
+        mappings: dict[SomeSubstitutionsType, SomeSubstitutionsType] | None = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            file_path: The path to the xacro file.
+            mappings: Mappings to be passed when expanding the xacro file.
+        """
+        super().__init__()
+        self.__file_path = normalize_to_list_of_substitutions(file_path)
+        # Normalize the mappings once instead of every time the substitution is performed
+        self.__mappings = [
+            (
+                normalize_to_list_of_substitutions(key),
+                normalize_to_list_of_substitutions(value),
+            )
+            for key, value in (mappings or {}).items()
+        ]
+
+    @property
+    def file_path(self) -> list[Substitution]:
+        """Getter for file_path."""
+        return self.__file_path
+
+    @property
+    def mappings(self) -> list[tuple[list[Substitution], list[Substitution]]]:
+        """Getter for mappings."""
+        return self.__mappings
+
+    def describe(self) -> str:
+        """Return a description of this substitution as a string."""
+        mappings_formatted = ", ".join(
+            f"{' + '.join(k.describe() for k in key)}:={' + '.join(v.describe() for v in value)}"
+            for key, value in self.__mappings
+        )
+        return f"Xacro(file_path = {' + '.join(s.describe() for s in self.__file_path)}, mappings = {{{mappings_formatted}}})"
+
+    def perform(self, context: LaunchContext) -> str:
+        """Perform the substitution by expanding the xacro file."""
+        return load_xacro(
+            Path(perform_substitutions(context, self.__file_path)),
+            mappings={
+                perform_substitutions(context, key): perform_substitutions(
+                    context,
+                    value,
+                )
+                for key, value in self.__mappings
+            },
+        )
@@ -0,0 +1,39 @@
+"""Fixtures shared by the moveit_configs_utils tests."""
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+INCLUDED_LINK_TEMPLATE = (
+    '<robot xmlns:xacro="http://ros.org/wiki/xacro"><link name="{link_name}"/></robot>'
+)
+
+
+@pytest.fixture()
+def robot_xacro(tmp_path: Path) -> Path:
+    """Create a xacro file with a `name` arg (Default: base) for a link's name, that includes a file with a link_1 link."""
+    included_file = tmp_path / "link.xacro"
+    included_file.write_text(INCLUDED_LINK_TEMPLATE.format(link_name="link_1"))
+    xacro_file = tmp_path / "robot.urdf.xacro"
+    xacro_file.write_text(
+        '<robot name="robot" xmlns:xacro="http://ros.org/wiki/xacro">'
+        '<xacro:arg name="name" default="base"/><link name="$(arg name)"/>'
+        f'<xacro:include filename="{included_file}"/></robot>',
+    )
+    return xacro_file
+
+
+@pytest.fixture()
+def rename_included_link(robot_xacro: Path) -> Callable[[str], None]:
+    """Get a function that renames the link in the file included by robot_xacro."""
+    included_file = robot_xacro.parent / "link.xacro"
+
+    def rename(link_name: str) -> None:
+        included_file.write_text(INCLUDED_LINK_TEMPLATE.format(link_name=link_name))
+        # Move the modification time forward, the file could be written within the filesystem's timestamp resolution
+        mtime_ns = included_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(included_file, ns=(mtime_ns, mtime_ns))
+
+    return rename
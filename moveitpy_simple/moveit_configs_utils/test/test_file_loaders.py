@@ -1,10 +1,18 @@
 """Test file loaders."""
 
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 
 import numpy as np
+import pytest
 
-from moveitpy_simple.moveit_configs_utils.file_loaders import load_file, load_yaml
+from moveitpy_simple.moveit_configs_utils import file_loaders
+from moveitpy_simple.moveit_configs_utils.file_loaders import (
+    load_file,
+    load_xacro,
+    load_yaml,
+)
 
 dir_path = Path(__file__).parent.absolute()
 
@@ -30,6 +38,19 @@ def test_laod_yaml():
     assert np.allclose(degrees, 57.2958, atol=1e-3)
     assert len(yaml_file["names"]) == 3
 
+    with pytest.raises(FileNotFoundError, match="doesn't exist"):
+        load_yaml(dir_path / "non_existing_file.yaml")
+
+
+def test_load_yaml_without_template(tmp_path: Path):
+    """Test load_yaml with a yaml file that doesn't use jinja2."""
+    yaml_file = tmp_path / "parameters.yaml"
+    yaml_file.write_text("names: {ur: 127.0.0.1}\nradians: 1.0\n")
+    assert load_yaml(yaml_file, mappings={"namespace": "env_0"}) == {
+        "names": {"ur": "127.0.0.1"},
+        "radians": 1.0,
+    }
+
 
 def test_load_file():
     """Test load_file with mappings."""
@@ -38,3 +59,31 @@ def test_load_file():
         mappings={"test_name": "testing"},
     )
     assert file_content == "This's a template parameter file testing"
+
+
+def test_load_xacro_cache(
+    robot_xacro: Path,
+    rename_included_link: Callable[[str], None],
+):
+    """Test load_xacro reloads the file when an included file is modified."""
+    urdf = load_xacro(robot_xacro, mappings={"name": "test"})
+    assert 'name="test"' in urdf
+    assert 'name="link_1"' in urdf
+    assert load_xacro(robot_xacro, mappings={"name": "test"}) == urdf
+    assert 'name="base"' in load_xacro(robot_xacro)
+
+    rename_included_link("link_2")
+    assert 'name="link_2"' in load_xacro(robot_xacro, mappings={"name": "test"})
+
+
+def test_load_xacro_cache_size(robot_xacro: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test load_xacro drops the least recently used expanded files once the cache is full."""
+    xacro_cache = OrderedDict()
+    monkeypatch.setattr(file_loaders, "_XACRO_CACHE", xacro_cache)
+    monkeypatch.setattr(file_loaders, "_XACRO_CACHE_SIZE", 2)
+    for name in ("link_a", "link_b", "link_a", "link_c"):
+        load_xacro(robot_xacro, mappings={"name": name})
+    assert [mappings for _, mappings in xacro_cache] == [
+        (("name", "link_a"),),
+        (("name", "link_c"),),
+    ]
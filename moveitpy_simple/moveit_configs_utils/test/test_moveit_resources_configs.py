@@ -1,17 +1,25 @@
 """Test the MoveItConfigsBuilder class."""
 
+import json
 import os
 import re
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+from launch.substitutions import LaunchConfiguration, TextSubstitution
 
-from moveitpy_simple.moveit_configs_utils import MoveItConfigsBuilder
+from moveitpy_simple.moveit_configs_utils import MoveItConfigs, MoveItConfigsBuilder
 from moveitpy_simple.moveit_configs_utils.moveit_configs_builder import (
     ConfigSections,
     PackageNotFoundError,
+    PlanningPipelinesConfigEntry,
+    _get_package_share_path,
+    _load_yaml_cached,
     extend_configs,
+    get_full_path,
     get_missing_configs,
+    get_package_path,
     load_moveit_configs_toml,
 )
 
@@ -140,6 +148,15 @@ def test_robot():
         elif pipeline_name == "chomp":
             assert pipeline_config.mappings == {"group_type": "chain"}
     assert builder.to_moveit_configs()
+    with pytest.raises(
+        RuntimeError,
+        match="Got 4 configs for the 3 planning pipelines",
+    ):
+        PlanningPipelinesConfigEntry(
+            pipelines=builder._planning_pipelines_config.pipelines[:3],
+            configs=builder._planning_pipelines_config.configs,
+            default_planning_pipeline="ompl",
+        )
 
     # Test passing in mappings to the robot description config without overriding the file path
     builder = MoveItConfigsBuilder(
@@ -153,6 +170,209 @@ def test_robot():
     assert builder.to_moveit_configs()
 
 
+def test_yaml_cache():
+    """Test that yaml files are only parsed once and the cached configs can't be modified."""
+    MoveItConfigsBuilder.clear_yaml_cache()
+    builder = (
+        MoveItConfigsBuilder(package=Path(dir_path, "robot_moveit_config"))
+        .robot_description_kinematics()
+        .joint_limits()
+    )
+    moveit_configs = builder.to_moveit_configs()
+    assert _load_yaml_cached.cache_info().misses == 2
+    moveit_configs.joint_limits["robot_description_planning"].clear()
+
+    # A new builder doesn't reuse the loaded configs, only the parsed yaml files
+    builder = (
+        MoveItConfigsBuilder(package=Path(dir_path, "robot_moveit_config"))
+        .robot_description_kinematics()
+        .joint_limits()
+    )
+    moveit_configs = builder.to_moveit_configs()
+    assert _load_yaml_cached.cache_info().misses == 2
+    assert _load_yaml_cached.cache_info().hits == 2
+    assert moveit_configs.joint_limits["robot_description_planning"]
+
+
+def test_moveit_configs_cache():
+    """Test that the builder reuses the loaded configs until its configs change."""
+    MoveItConfigsBuilder.clear_yaml_cache()
+    builder = (
+        MoveItConfigsBuilder(package=Path(dir_path, "robot_moveit_config"))
+        .robot_description_kinematics()
+        .joint_limits()
+    )
+    moveit_configs = builder.to_moveit_configs()
+    moveit_configs.joint_limits["robot_description_planning"].clear()
+    moveit_configs = builder.to_moveit_configs()
+    assert moveit_configs.joint_limits["robot_description_planning"]
+    assert _load_yaml_cached.cache_info().hits == 0
+
+    builder.trajectory_execution()
+    moveit_configs = builder.to_moveit_configs()
+    assert moveit_configs.trajectory_execution is not None
+    assert _load_yaml_cached.cache_info().hits == 2
+
+    builder.clear_cache()
+    builder.to_moveit_configs()
+    assert _load_yaml_cached.cache_info().hits == 0
+    assert _load_yaml_cached.cache_info().misses == 3
+
+
+def test_moveit_configs_cache_parameter_value(robot_xacro: Path):
+    """Test that the reused configs share the robot description's ParameterValue but not the sections' dicts."""
+    builder = MoveItConfigsBuilder(
+        package=Path(dir_path, "robot_moveit_config"),
+    ).robot_description(
+        file_path=robot_xacro,
+        mappings={"name": LaunchConfiguration("name")},
+    )
+    first_moveit_configs = builder.to_moveit_configs()
+    second_moveit_configs = builder.to_moveit_configs()
+    assert (
+        first_moveit_configs.robot_description
+        is not second_moveit_configs.robot_description
+    )
+    assert (
+        first_moveit_configs.robot_description["robot_description"]
+        is second_moveit_configs.robot_description["robot_description"]
+    )
+
+
+def test_shared_config_file(tmp_path: Path):
+    """Test that configs loaded from the same file don't share their parameters."""
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "ompl_planning.yaml").write_text(
+        "planning_plugin: ompl_interface/OMPLPlanner\n",
+    )
+    (tmp_path / "moveit_configs.toml").write_text(
+        "[moveit_configs]\n"
+        'robot_description_kinematics = "config/ompl_planning.yaml"\n'
+        'joint_limits = "config/ompl_planning.yaml"\n'
+        "[moveit_configs.planning_pipelines]\n"
+        'ompl = "config/ompl_planning.yaml"\n'
+        'ompl2 = "config/ompl_planning.yaml"\n',
+    )
+    moveit_configs = (
+        MoveItConfigsBuilder(package=tmp_path)
+        .robot_description_kinematics()
+        .joint_limits()
+        .planning_pipelines()
+        .to_moveit_configs()
+    )
+    planning_pipelines = moveit_configs.planning_pipelines
+    assert planning_pipelines["ompl"] == planning_pipelines["ompl2"]
+    assert planning_pipelines["ompl"] is not planning_pipelines["ompl2"]
+    assert (
+        moveit_configs.robot_description_kinematics["robot_description_kinematics"]
+        is not moveit_configs.joint_limits["robot_description_planning"]
+    )
+
+
+def test_empty_config(tmp_path: Path):
+    """Test that a section loaded from an empty file is an empty dict."""
+    empty_file = tmp_path / "joint_limits.yaml"
+    empty_file.touch()
+    moveit_configs = (
+        MoveItConfigsBuilder(package=Path(dir_path, "robot_moveit_config"))
+        .joint_limits(file_path=empty_file)
+        .moveit_cpp(file_path=empty_file)
+        .to_moveit_configs()
+    )
+    assert moveit_configs.joint_limits == {}
+    assert moveit_configs.moveit_cpp == {}
+    assert moveit_configs.sensors_3d is None
+
+
+def test_text_substitution_mappings(robot_xacro: Path):
+    """Test that a xacro file with text substitution mappings is loaded when creating the configs."""
+    builder = MoveItConfigsBuilder(
+        package=Path(dir_path, "robot_moveit_config"),
+    ).robot_description(
+        file_path=robot_xacro,
+        mappings={"name": [TextSubstitution(text="ker"), "mit"]},
+    )
+    assert builder._robot_description_config.mappings == {"name": "kermit"}
+    robot_description = builder.to_moveit_configs().robot_description
+    assert 'name="kermit"' in robot_description["robot_description"]
+
+
+def test_mappings_copied(tmp_path: Path):
+    """Test that modifying the mappings after passing them to the builder doesn't change the loaded configs."""
+    kinematics_file = tmp_path / "kinematics.yaml"
+    kinematics_file.write_text("{{ group }}:\n  kinematics_solver_timeout: 0.1\n")
+    mappings = {"group": "arm"}
+    builder = MoveItConfigsBuilder(
+        package=Path(dir_path, "robot_moveit_config"),
+    ).robot_description_kinematics(file_path=kinematics_file, mappings=mappings)
+    mappings["group"] = "gripper"
+    assert builder._robot_description_kinematics_config.mappings == {"group": "arm"}
+    robot_description_kinematics = (
+        builder.to_moveit_configs().robot_description_kinematics
+    )
+    assert list(
+        robot_description_kinematics["robot_description_kinematics"],
+    ) == ["arm"]
+
+
+def test_freeze(
+    tmp_path: Path,
+    robot_xacro: Path,
+    rename_included_link: Callable[[str], None],
+):
+    """Test freezing the configs to a file and loading them back."""
+    builder = (
+        MoveItConfigsBuilder(package=Path(dir_path, "robot_moveit_config"))
+        .robot_description(file_path=robot_xacro, mappings={"name": "kermit"})
+        .robot_description_kinematics()
+        .planning_pipelines()
+        .joint_limits()
+    )
+    frozen_file = tmp_path / "moveit_configs.json"
+    moveit_configs = builder.freeze(frozen_file)
+    assert frozen_file.exists()
+    assert builder.from_frozen(frozen_file) == moveit_configs
+
+    # Changing the builder's configs freezes the configs again
+    builder.robot_description(file_path=robot_xacro, mappings={"name": "piggy"})
+    moveit_configs = builder.from_frozen(frozen_file)
+    assert 'name="piggy"' in moveit_configs.robot_description["robot_description"]
+    assert builder.from_frozen(frozen_file) == moveit_configs
+
+    # Modifying a file included by the robot description freezes the configs again
+    rename_included_link("link_2")
+    moveit_configs = builder.from_frozen(frozen_file)
+    assert 'name="link_2"' in moveit_configs.robot_description["robot_description"]
+
+
+def test_freeze_incompatible_file(tmp_path: Path):
+    """Test that configs are frozen again when the frozen file can't be used, and configs json can't represent."""
+    builder = MoveItConfigsBuilder(
+        package=Path(dir_path, "robot_moveit_config"),
+    ).joint_limits()
+    moveit_configs = builder.to_moveit_configs()
+    frozen_file = tmp_path / "moveit_configs.json"
+
+    frozen_file.write_text("not json")
+    assert builder.from_frozen(frozen_file) == moveit_configs
+
+    # A file frozen with a different set of MoveItConfigs fields
+    frozen = json.loads(frozen_file.read_text())
+    frozen["moveit_configs"]["removed_section"] = {}
+    frozen_file.write_text(json.dumps(frozen))
+    assert builder.from_frozen(frozen_file) == moveit_configs
+    assert (
+        "removed_section" not in json.loads(frozen_file.read_text())["moveit_configs"]
+    )
+
+    # Non-string keys would come back as strings
+    yaml_file = tmp_path / "moveit_cpp.yaml"
+    yaml_file.write_text("1: one\n")
+    builder.moveit_cpp(file_path=yaml_file)
+    with pytest.raises(TypeError, match="can't be frozen"):
+        builder.freeze(frozen_file)
+
+
 def test_extend():
     """Test extending a MoveItConfigsBuilder with additional configs from a different package."""
     robot_package_path = Path(dir_path, "robot_moveit_config")
@@ -238,6 +458,31 @@ def test_extend():
     assert configs[ConfigSections.ROBOT_DESCRIPTION_SEMANTIC] == {"group_type": "chain"}
 
 
+def test_load_moveit_configs_toml_cache(tmp_path: Path):
+    """Test that loaded toml files are cached, copied, and reloaded when modified."""
+    robot_package_path = Path(dir_path, "robot2_moveit_config")
+    configs = load_moveit_configs_toml(robot_package_path)
+    extend_configs(robot_package_path, configs)
+    assert (
+        load_moveit_configs_toml(robot_package_path)[ConfigSections.MOVEIT_CONFIGS][
+            ConfigSections.EXTEND
+        ]
+        == "../robot_moveit_config"
+    )
+
+    configs_file = tmp_path / "moveit_configs.toml"
+    configs_file.write_text('[moveit_configs]\nrobot_description = "robot.urdf"\n')
+    assert load_moveit_configs_toml(tmp_path) == {
+        "moveit_configs": {"robot_description": "robot.urdf"},
+    }
+    configs_file.write_text('[moveit_configs]\nrobot_description = "robot2.urdf"\n')
+    mtime_ns = configs_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(configs_file, ns=(mtime_ns, mtime_ns))
+    assert load_moveit_configs_toml(tmp_path) == {
+        "moveit_configs": {"robot_description": "robot2.urdf"},
+    }
+
+
 def test_extend_builder():
     """Test extending a MoveItConfigsBuilder with additional configs from a different package and creating MoveItConfigs class."""
     builder = (
@@ -299,7 +544,7 @@ def test_extend_panda():
 
     moveit_configs = builder.to_moveit_configs()
     assert moveit_configs.robot_description
-    assert moveit_configs.robot_description_semantic == {}
+    assert moveit_configs.robot_description_semantic is None
     assert (
         moveit_configs.robot_description_kinematics["robot_description_kinematics"][
             "panda_arm"
@@ -320,6 +565,123 @@ def test_extend_non_existing_package():
         MoveItConfigsBuilder(package=Path(dir_path, "existing_moveit_config"))
 
 
+def test_extend_cycle(tmp_path: Path):
+    """Test that packages extending each other raise an error instead of looping forever."""
+    self_extending_package = tmp_path / "self_extending_moveit_config"
+    self_extending_package.mkdir()
+    (self_extending_package / "moveit_configs.toml").write_text(
+        '[moveit_configs]\nextend = "."\nrobot_description = "robot.urdf"\n',
+    )
+    with pytest.raises(RuntimeError, match="Cyclic extend"):
+        MoveItConfigsBuilder(package=self_extending_package)
+
+    first_package = tmp_path / "first_moveit_config"
+    second_package = tmp_path / "second_moveit_config"
+    for package, base_package in (
+        (first_package, second_package),
+        (second_package, first_package),
+    ):
+        package.mkdir()
+        (package / "moveit_configs.toml").write_text(
+            f'[moveit_configs]\nextend = "../{base_package.name}"\n',
+        )
+    with pytest.raises(RuntimeError, match="Cyclic extend"):
+        MoveItConfigsBuilder(package=first_package)
+
+
+def test_extend_sibling_toml(tmp_path: Path):
+    """Test extending a toml file with another toml file in the same package."""
+    (tmp_path / "base.toml").write_text(
+        '[moveit_configs]\nrobot_description = "config/base.urdf"\n'
+        'robot_description_semantic = "config/base.srdf"\n',
+    )
+    (tmp_path / "extending.toml").write_text(
+        '[moveit_configs]\nextend = "base.toml"\nrobot_description = "config/extending.urdf"\n',
+    )
+    configs = extend_configs(
+        tmp_path,
+        load_moveit_configs_toml(tmp_path / "extending.toml"),
+    )
+    moveit_configs = configs[ConfigSections.MOVEIT_CONFIGS]
+    assert moveit_configs[ConfigSections.ROBOT_DESCRIPTION] == "config/extending.urdf"
+    assert (
+        moveit_configs[ConfigSections.ROBOT_DESCRIPTION_SEMANTIC]
+        == tmp_path / "config" / "base.srdf"
+    )
+
+
+def test_extend_chain(tmp_path: Path):
+    """Test a chain of local packages, each extend is resolved relative to the package that contains it."""
+    first_package = tmp_path / "first_moveit_config"
+    second_package = tmp_path / "second_moveit_config"
+    third_package = tmp_path / "third_moveit_config"
+    for package, moveit_configs in (
+        (
+            first_package,
+            'extend = "../second_moveit_config"\nrobot_description = "robot.urdf"\n',
+        ),
+        (
+            second_package,
+            'extend = "../third_moveit_config"\nrobot_description_semantic = "robot.srdf"\n',
+        ),
+        (
+            third_package,
+            'joint_limits = "joint_limits.yaml"\nrobot_description = "third.urdf"\n',
+        ),
+    ):
+        package.mkdir()
+        (package / "moveit_configs.toml").write_text(
+            f"[moveit_configs]\n{moveit_configs}",
+        )
+    configs = extend_configs(first_package, load_moveit_configs_toml(first_package))
+    moveit_configs = configs[ConfigSections.MOVEIT_CONFIGS]
+    assert moveit_configs[ConfigSections.ROBOT_DESCRIPTION] == "robot.urdf"
+    assert (
+        moveit_configs[ConfigSections.ROBOT_DESCRIPTION_SEMANTIC].resolve()
+        == second_package / "robot.srdf"
+    )
+    assert (
+        moveit_configs[ConfigSections.JOINT_LIMITS].resolve()
+        == third_package / "joint_limits.yaml"
+    )
+
+
+def test_package_lookup_cache():
+    """Test that resolving the same package multiple times only queries the ament index once."""
+    _get_package_share_path.cache_clear()
+    package_path = get_full_path("moveit_resources_panda_moveit_config")
+    assert get_package_path("moveit_resources_panda_moveit_config") == package_path
+    MoveItConfigsBuilder(package="moveit_resources_panda_moveit_config")
+    cache_info = _get_package_share_path.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits >= 2
+
+    with pytest.raises(PackageNotFoundError):
+        get_full_path("non_existing_package")
+    assert _get_package_share_path.cache_info().currsize == 1
+
+
+def test_moveit_configs_to_dict():
+    """Test merging the MoveItConfigs parameters in a dict."""
+    moveit_configs = MoveItConfigs(
+        robot_description={"robot_description": "<robot/>"},
+        joint_limits={"robot_description_planning": {"joint_limits": {}}},
+        pilz_cartesian_limits={"cartesian_limits": {"max_trans_vel": 1.0}},
+    )
+    assert moveit_configs.to_dict() == {
+        "robot_description": "<robot/>",
+        "robot_description_planning": {
+            "joint_limits": {},
+            "cartesian_limits": {"max_trans_vel": 1.0},
+        },
+    }
+    assert moveit_configs.joint_limits == {
+        "robot_description_planning": {"joint_limits": {}},
+    }
+    # The sections are stored in slots, not in an instance dict
+    assert not hasattr(moveit_configs, "__dict__")
+
+
 def test_load_all():
     """Test automatically loading all configs from a package."""
     builder = MoveItConfigsBuilder(
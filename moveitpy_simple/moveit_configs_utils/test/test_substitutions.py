@@ -0,0 +1,27 @@
+"""Test launch substitutions."""
+
+from pathlib import Path
+
+from launch.launch_context import LaunchContext
+from launch.substitutions import LaunchConfiguration
+
+from moveitpy_simple.moveit_configs_utils.file_loaders import load_xacro
+from moveitpy_simple.moveit_configs_utils.substitutions import Xacro
+
+
+def test_xacro(robot_xacro: Path):
+    """Test expanding a xacro file with launch configurations in the mappings."""
+    context = LaunchContext()
+    context.launch_configurations["arg_name"] = "name"
+    context.launch_configurations["link_name"] = "kermit"
+    substitution = Xacro(
+        str(robot_xacro),
+        mappings={LaunchConfiguration("arg_name"): LaunchConfiguration("link_name")},
+    )
+    expanded_file = substitution.perform(context)
+    assert expanded_file == load_xacro(robot_xacro, mappings={"name": "kermit"})
+    assert 'name="kermit"' in expanded_file
+    assert (
+        substitution.describe()
+        == f"Xacro(file_path = '{robot_xacro}', mappings = {{LaunchConfig('arg_name'):=LaunchConfig('link_name')}})"
+    )